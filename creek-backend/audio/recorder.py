@@ -1,8 +1,7 @@
 import os
-import wave
 import time
+import struct
 import threading
-import queue
 import sounddevice as sd
 import numpy as np
 from pathlib import Path
@@ -11,6 +10,10 @@ from datetime import datetime
 
 from config import config
 
+# Number of chunk slots in the ring buffer. A power of two so head/tail
+# indices wrap with a cheap bitmask instead of a modulo.
+_RING_SLOTS = 64
+
 class AudioRecorder:
     def __init__(self, sample_rate: int = None, channels: int = None, chunk_size: int = None):
         """Initialize the audio recorder with configuration."""
@@ -18,57 +21,130 @@ class AudioRecorder:
         self.channels = channels or config.get('recording', 'channels')
         self.chunk_size = chunk_size or config.get('recording', 'chunk_size')
         self.max_duration = config.get('recording', 'max_duration_minutes') * 60  # Convert to seconds
-        
+
         self.recording = False
-        self.audio_queue = queue.Queue()
-        self.frames = []
         self.start_time = None
-        self.recording_thread = None
-        self.processing_thread = None
         self.callback = None
-        
+        self.drain_thread = None
+
+        # Single-producer/single-consumer ring buffer between the PortAudio
+        # callback thread and the drain thread. The callback only writes
+        # _head, the consumer only writes _tail; a single int attribute
+        # assignment is one machine-word store and atomic under the GIL, so
+        # no mutex is taken on the real-time audio thread.
+        self._ring = np.empty((_RING_SLOTS, self.chunk_size, self.channels), dtype=np.float32)
+        # Valid frame count per slot; PortAudio can deliver a short final
+        # block when the stream is stopped
+        self._ring_frames = [0] * _RING_SLOTS
+        self._ring_mask = _RING_SLOTS - 1
+        self._head = 0
+        self._tail = 0
+        # Set by the callback when a slot is filled (and by stop_recording)
+        # so the drain thread parks instead of polling while the ring is empty
+        self._data_ready = threading.Event()
+
+        # Chunks are streamed to disk as they arrive, so peak memory is one
+        # chunk regardless of recording length
+        self._frames_written = 0
+        self._max_frames = int(self.max_duration * self.sample_rate)
+        self._wav_fp = None
+
+        # The RIFF/WAVE header depends only on the channel count and sample
+        # rate fixed here, so build the 44-byte template once; only the two
+        # size fields get patched when the recording stops
+        self._hdr = bytearray(44)
+        struct.pack_into(
+            '<4sI4s4sIHHIIHH4sI', self._hdr, 0,
+            b'RIFF', 0, b'WAVE', b'fmt ', 16, 1, self.channels,
+            self.sample_rate, self.sample_rate * self.channels * 2,
+            self.channels * 2, 16, b'data', 0
+        )
+        # Reused scratch buffer for the float32 -> int16 conversion
+        self._i16_scratch = np.empty((self.chunk_size, self.channels), dtype=np.int16)
+
         # Ensure output directory exists
         self.output_dir = Path(config.get('recording', 'save_directory'))
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _audio_callback(self, indata, frames, time_info, status):
-        """Callback for audio stream."""
+        """Callback for audio stream. Copies the chunk into the next free
+        ring slot; no locks, no allocation on the real-time thread."""
         if status:
             print(f"Audio status: {status}")
-        self.audio_queue.put(indata.copy())
-
-    def _process_audio(self):
-        """Process audio data from the queue and save to frames."""
-        while self.recording or not self.audio_queue.empty():
-            try:
-                data = self.audio_queue.get(timeout=0.5)
-                self.frames.append(data)
-                
-                # Call the progress callback if provided
-                if self.callback:
-                    duration = (len(self.frames) * self.chunk_size) / self.sample_rate
-                    self.callback(duration, len(data))
-                    
-            except queue.Empty:
+        head = self._head
+        if head - self._tail >= _RING_SLOTS:
+            # Ring full (consumer stalled); drop the chunk rather than block
+            return
+        # The ring slot matches indata's dtype and layout, so this is a
+        # straight memcpy with no cast and no new ndarray
+        slot = head & self._ring_mask
+        np.copyto(self._ring[slot, :frames], indata)
+        self._ring_frames[slot] = frames
+        self._head = head + 1
+        self._data_ready.set()
+
+    def _drain(self):
+        """Consumer thread: convert filled ring slots to 16-bit PCM and
+        stream them to the WAV file."""
+        while True:
+            tail = self._tail
+            if tail == self._head:
+                if not self.recording:
+                    break
+                # Clear-then-recheck avoids losing a wakeup: the callback
+                # sets the event only after publishing a new head, so either
+                # the recheck sees the data or wait() returns immediately
+                self._data_ready.clear()
+                if self._tail == self._head and self.recording:
+                    self._data_ready.wait()
                 continue
+            slot = tail & self._ring_mask
+            chunk = self._ring[slot, :self._ring_frames[slot]]
+            if self._frames_written + len(chunk) <= self._max_frames:
+                # Past max_duration the chunk is dropped.
+                # Scale in place on the ring slot (free until tail advances),
+                # clip so peaks saturate instead of wrapping, and let NumPy's
+                # SIMD cast fill the int16 scratch; the file write takes the
+                # scratch's buffer directly, with no tobytes copy
+                scratch = self._i16_scratch[:len(chunk)]
+                np.multiply(chunk, 32767.0, out=chunk)
+                np.clip(chunk, -32768.0, 32767.0, out=chunk)
+                scratch[:] = chunk
+                self._wav_fp.write(scratch)
+                self._frames_written += len(chunk)
+            self._tail = tail + 1
+
+            # Call the progress callback if provided
+            if self.callback:
+                self.callback(self._frames_written / self.sample_rate, len(chunk))
 
     def start_recording(self, callback: Optional[Callable] = None) -> str:
         """Start recording audio.
-        
+
         Args:
             callback: Function to call with progress updates (duration_seconds, chunk_size)
-            
+
         Returns:
             str: Path to the saved audio file
         """
         if self.recording:
             raise RuntimeError("Recording is already in progress")
-            
+
         self.callback = callback
         self.recording = True
-        self.frames = []
+        self._head = 0
+        self._tail = 0
+        self._data_ready.clear()
+        self._frames_written = 0
         self.start_time = time.time()
-        
+
+        # Generate output filename and open the WAV file for streaming.
+        # The large write buffer amortizes syscalls over many small chunks.
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_file = self.output_dir / f"recording_{timestamp}.wav"
+        self._wav_fp = open(self.output_file, 'wb', buffering=1 << 20)
+        self._wav_fp.write(self._hdr)
+
         # Start the audio stream
         self.stream = sd.InputStream(
             samplerate=self.sample_rate,
@@ -77,71 +153,62 @@ class AudioRecorder:
             blocksize=self.chunk_size,
             dtype='float32'
         )
-        
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self._process_audio)
-        self.processing_thread.start()
-        
+
+        # Start the drain thread
+        self.drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self.drain_thread.start()
+
         # Start the stream
         self.stream.start()
-        
-        # Generate output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_file = self.output_dir / f"recording_{timestamp}.wav"
-        
+
         return str(self.output_file)
 
     def stop_recording(self) -> str:
         """Stop recording and save the audio file.
-        
+
         Returns:
             str: Path to the saved audio file
         """
         if not self.recording:
             raise RuntimeError("No recording in progress")
-            
+
         # Stop the stream
         self.stream.stop()
         self.stream.close()
         self.recording = False
-        
-        # Wait for processing to finish
-        if self.processing_thread:
-            self.processing_thread.join()
-        
-        # Save the recording
-        if self.frames:
-            audio_data = np.concatenate(self.frames, axis=0)
-            self._save_wav(audio_data, self.output_file)
-            
+        # Wake the drain thread so it can observe the stop and exit
+        self._data_ready.set()
+
+        # Wait for the drain thread to empty the ring
+        if self.drain_thread:
+            self.drain_thread.join()
+
+        # Patch the RIFF and data sizes into the header template and
+        # rewrite it in place, then close
+        data_bytes = self._frames_written * self.channels * 2
+        struct.pack_into('<I', self._hdr, 4, 36 + data_bytes)
+        struct.pack_into('<I', self._hdr, 40, data_bytes)
+        self._wav_fp.seek(0)
+        self._wav_fp.write(self._hdr)
+        self._wav_fp.close()
+
         return str(self.output_file)
-    
-    def _save_wav(self, audio_data: np.ndarray, filepath: Path) -> None:
-        """Save audio data to a WAV file."""
-        # Convert to 16-bit PCM
-        audio_data = (audio_data * 32767).astype(np.int16)
-        
-        with wave.open(str(filepath), 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
-    
+
     def record(self, duration: Optional[float] = None, callback: Optional[Callable] = None) -> str:
         """Record audio for a specified duration.
-        
+
         Args:
             duration: Duration to record in seconds. If None, uses max_duration from config.
             callback: Function to call with progress updates (duration_seconds, chunk_size)
-            
+
         Returns:
             str: Path to the saved audio file
         """
         if duration is None:
             duration = self.max_duration
-            
+
         output_file = self.start_recording(callback)
-        
+
         try:
             # Wait for the specified duration or until interrupted
             time.sleep(duration)
@@ -1,4 +1,7 @@
 import json
+import os
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -7,6 +10,11 @@ class ConfigManager:
         """Initialize the configuration manager with the path to the config file."""
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        # Config is effectively immutable between update() calls, so memoize
+        # lookups per key tuple; update() clears the cache.
+        self.get = lru_cache(maxsize=64)(self._get)
+        # Pre-serialized config payload for endpoints that return it verbatim
+        self.serialized = orjson.dumps(self.config)
         self._create_directories()
 
     def _load_config(self) -> Dict[str, Any]:
@@ -30,7 +38,7 @@ class ConfigManager:
             out_dir = Path(output_format['save_directory'])
             out_dir.mkdir(parents=True, exist_ok=True)
 
-    def get(self, *keys) -> Any:
+    def _get(self, *keys) -> Any:
         """Get a nested config value using dot notation."""
         value = self.config
         for key in keys:
@@ -48,12 +56,21 @@ class ConfigManager:
             return d
         
         self.config = update_nested(self.config, updates)
+        self.get.cache_clear()
+        self.serialized = orjson.dumps(self.config)
         self._save_config()
 
     def _save_config(self) -> None:
-        """Save the current configuration to file."""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        """Atomically save the current configuration to file."""
+        # Serialize once and write in a single call, then replace the old
+        # file atomically so a crash mid-save never leaves a truncated config
+        data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        tmp_path = self.config_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_path)
 
 # Global config instance
 config = ConfigManager()
@@ -3,9 +3,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from config import config, ConfigManager
@@ -16,7 +17,8 @@ from processing.formatter import SermonFormatter
 app = FastAPI(
     title="Sermon Transcription API",
     description="API for recording, transcribing, and processing sermons",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware to allow frontend connections
@@ -64,8 +66,19 @@ class ConnectionManager:
         self.active_connections.remove(websocket)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        # Snapshot the list so a concurrent disconnect can't mutate it
+        # mid-broadcast, then fan out all sends concurrently so total
+        # latency is the slowest client rather than the sum of all clients
+        connections = list(self.active_connections)
+        if not connections:
+            return
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception) and connection in self.active_connections:
+                self.disconnect(connection)
 
 manager = ConnectionManager()
 
@@ -80,9 +93,11 @@ async def health_check() -> Dict[str, Any]:
     }
 
 @app.get("/api/config")
-async def get_config() -> Dict[str, Any]:
+async def get_config() -> Response:
     """Get current configuration"""
-    return config.config
+    # The config is serialized once on load/update, so this is a plain
+    # memcpy of cached bytes instead of a per-request json.dumps
+    return Response(content=config.serialized, media_type="application/json")
 
 @app.websocket("/ws/recording")
 async def websocket_endpoint(websocket: WebSocket):
@@ -158,20 +173,34 @@ async def list_recordings():
     recordings_dir = Path(config.get('recording', 'save_directory'))
     if not recordings_dir.exists():
         return []
-    
-    recordings = []
-    for file in recordings_dir.glob("*.wav"):
-        stats = file.stat()
-        recordings.append({
-            "name": file.name,
-            "path": str(file),
-            "size": stats.st_size,
-            "created": stats.st_ctime,
-            "modified": stats.st_mtime
-        })
-    
+
+    # scandir's DirEntry caches the stat from the directory read, so this
+    # is one batched listing instead of a glob plus a stat syscall per file
+    with os.scandir(recordings_dir) as it:
+        recordings = [
+            {
+                "name": entry.name,
+                "path": entry.path,
+                "size": (stats := entry.stat()).st_size,
+                "created": stats.st_ctime,
+                "modified": stats.st_mtime
+            }
+            for entry in it
+            if entry.is_file() and entry.name.endswith(".wav")
+        ]
+
     return sorted(recordings, key=lambda x: x["modified"], reverse=True)
 
+def _save_upload(src, dst) -> None:
+    """Copy an uploaded file to disk without bouncing through small buffers."""
+    if hasattr(src, 'getbuffer'):
+        # Upload is still in the spool's in-memory buffer; write it directly
+        dst.write(src.getbuffer())
+    else:
+        # Spilled to disk; copy with a 1 MiB buffer instead of the 16 KiB
+        # default so the copy is a handful of syscalls rather than hundreds
+        shutil.copyfileobj(src, dst, length=1 << 20)
+
 @app.post("/api/transcribe")
 async def transcribe_audio(
     file: UploadFile = File(...),
@@ -181,16 +210,18 @@ async def transcribe_audio(
     # Save the uploaded file
     temp_file = Path("temp_" + file.filename)
     try:
+        # Both the upload copy and the formatter do blocking file I/O, so
+        # run them in the threadpool to keep the event loop free
         with open(temp_file, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
+            await run_in_threadpool(_save_upload, file.file, buffer)
+
         # TODO: Implement transcription using your model
         # This is a placeholder - you'll need to integrate with your actual model
         transcript = "This is a placeholder for the transcribed text."
-        
+
         # Format the transcript
         metadata_dict = json.loads(metadata) if metadata else {}
-        formatted = formatter.format_sermon(transcript, metadata_dict)
+        formatted = await run_in_threadpool(formatter.format_sermon, transcript, metadata_dict)
         
         return {
             "transcript": transcript,
@@ -205,12 +236,31 @@ async def transcribe_audio(
             temp_file.unlink()
 
 @app.get("/api/recordings/{filename}")
-async def get_recording(filename: str):
+async def get_recording(filename: str, request: Request):
     """Get a recording file"""
     file_path = Path(config.get('recording', 'save_directory')) / filename
-    if not file_path.exists():
+    try:
+        stats = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
-    return FileResponse(file_path)
+
+    # Stable ETag from size+mtime lets clients revalidate instead of
+    # re-downloading the whole WAV on every playback
+    etag = f'"{stats.st_size:x}-{int(stats.st_mtime):x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Pass the stat result so FileResponse doesn't stat the file again;
+    # it serves Range requests from it, so clients can seek and resume
+    return FileResponse(
+        file_path,
+        stat_result=stats,
+        headers={
+            "ETag": etag,
+            "Cache-Control": "private, max-age=3600",
+            "Accept-Ranges": "bytes"
+        }
+    )
 
 # Background task for processing recordings
 async def process_recording(session_id: str):
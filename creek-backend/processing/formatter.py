@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -9,12 +10,50 @@ from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
 from config import config
 
+# Periods not already followed by a space (or at end of text)
+_RE_DOT = re.compile(r'\.(?! |$)')
+# Runs of two or more spaces
+_RE_SPACES = re.compile(r' {2,}')
+# Lowercase letter at the start of the text or of a new sentence
+_RE_SENT = re.compile(r'(?:^|(?<=[.!?]\s))([a-z])')
+# A paragraph: consecutive non-empty lines (blank lines separate paragraphs)
+_RE_PARA = re.compile(r'[^\n]+(?:\n(?!\n)[^\n]+)*')
+# Fused cleanup: everything _capitalize_sentences and _fix_punctuation do,
+# matched in one scan. Alternatives, in order: a sentence-starting lowercase
+# letter (with any spaces before it), a lowercase letter right after
+# punctuation-plus-whitespace, a run of spaces, a period missing its space.
+_RE_CLEAN = re.compile(r'(?:^|(?<=[.!?])) *([a-z])|(?<=[.!?]\s)([a-z])|( {2,})|\.(?! |$)')
+
+def _clean_repl(match):
+    start = match.group(1)
+    if start is not None:
+        # Sentence start: exactly one space after the punctuation (none at
+        # the start of the text) and an uppercase letter
+        return start.upper() if match.start() == 0 else ' ' + start.upper()
+    if match.group(2) is not None:
+        return match.group(2).upper()
+    if match.group(3) is not None:
+        return ' '
+    # Period with no following space. If a lowercase letter follows, the
+    # sentence-start alternative will supply the space along with the
+    # capital; adding one here too would double it.
+    nxt = match.string[match.end():match.end() + 1]
+    return '.' if nxt.isascii() and nxt.islower() else '. '
+
 class SermonFormatter:
     def __init__(self):
         self.config = config
         self.metadata = self.config.get('metadata')
         self.output_configs = self.config.get('output', 'formats')
-        
+        # Config is fixed for the lifetime of the formatter, so resolve the
+        # cleanup flags once instead of traversing the config dict per sermon.
+        self._capitalize = bool(self.config.get('post_processing', 'text_cleanup', 'capitalize_sentences'))
+        self._fix_punct = bool(self.config.get('post_processing', 'text_cleanup', 'fix_punctuation'))
+        # Create output directories once here instead of stat'ing them on
+        # every save
+        for fmt in self.output_configs:
+            Path(fmt['save_directory']).mkdir(parents=True, exist_ok=True)
+
     def format_sermon(self, transcription: str, metadata: Optional[Dict] = None) -> Dict[str, str]:
         """Format the sermon transcription according to the configuration.
         
@@ -30,14 +69,17 @@ class SermonFormatter:
             
         # Merge default metadata with provided metadata
         metadata = {**self.metadata, **metadata}
-        
+
+        # Single timestamp for both the filename and the title fallback
+        now = datetime.now()
+
         # Generate base filename
-        filename = datetime.now().strftime(
+        filename = now.strftime(
             self.config.get('output', 'naming_convention')
         )
-        
+
         # Create formatted content
-        formatted_content = self._apply_formatting(transcription, metadata)
+        formatted_content = self._apply_formatting(transcription, metadata, now)
         
         # Save in all requested formats
         output_files = {}
@@ -48,7 +90,7 @@ class SermonFormatter:
             
         return output_files
     
-    def _apply_formatting(self, text: str, metadata: Dict) -> Dict[str, Any]:
+    def _apply_formatting(self, text: str, metadata: Dict, now: datetime) -> Dict[str, Any]:
         """Apply formatting to the raw transcription."""
         # This is a simple formatter - you can enhance this with more sophisticated logic
         sections = {}
@@ -57,17 +99,19 @@ class SermonFormatter:
         formatting = self.config.get('post_processing', 'formatting')
         
         # Apply text cleanup
-        if self.config.get('post_processing', 'text_cleanup', 'capitalize_sentences'):
+        if self._capitalize and self._fix_punct:
+            # The usual configuration: both cleanups in a single scan
+            text = self._clean_text(text)
+        elif self._capitalize:
             text = self._capitalize_sentences(text)
-            
-        if self.config.get('post_processing', 'text_cleanup', 'fix_punctuation'):
+        elif self._fix_punct:
             text = self._fix_punctuation(text)
         
         # For now, just return the text with some basic formatting
         # In a real implementation, you would parse the text and structure it
         # according to the sections in the config
         return {
-            'title': f"Sermon - {metadata.get('default_date', datetime.now().strftime('%Y-%m-%d'))}",
+            'title': f"Sermon - {metadata.get('default_date', now.strftime('%Y-%m-%d'))}",
             'content': text,
             'metadata': metadata
         }
@@ -75,8 +119,7 @@ class SermonFormatter:
     def _save_format(self, fmt: Dict, filename: str, content: Dict, metadata: Dict) -> str:
         """Save content in the specified format."""
         save_dir = Path(fmt['save_directory'])
-        save_dir.mkdir(parents=True, exist_ok=True)
-        
+
         if fmt['type'] == 'txt':
             return self._save_txt(save_dir, filename, content)
         elif fmt['type'] == 'docx':
@@ -87,30 +130,36 @@ class SermonFormatter:
     def _save_txt(self, directory: Path, filename: str, content: Dict) -> str:
         """Save content as a text file."""
         filepath = directory / f"{filename}.txt"
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Write title
-            f.write(f"{content['title']}\n")
-            f.write("=" * len(content['title']) + "\n\n")
-            
-            # Write metadata
-            if 'metadata' in content:
-                f.write("METADATA\n")
-                f.write("-" * 8 + "\n")
-                for key, value in content['metadata'].items():
-                    if isinstance(value, dict):
-                        f.write(f"{key}:\n")
-                        for k, v in value.items():
-                            f.write(f"  {k}: {v}\n")
-                    else:
-                        f.write(f"{key}: {value}\n")
-                f.write("\n")
-            
-            # Write content
-            f.write("TRANSCRIPTION\n")
-            f.write("-" * 12 + "\n")
-            f.write(content['content'] + "\n")
-            
+
+        # Build the whole document in memory and write it in one go, so the
+        # metadata loop doesn't issue one encode+write cycle per entry
+        parts = []
+
+        # Title
+        parts.append(f"{content['title']}\n")
+        parts.append("=" * len(content['title']) + "\n\n")
+
+        # Metadata
+        if 'metadata' in content:
+            parts.append("METADATA\n")
+            parts.append("-" * 8 + "\n")
+            for key, value in content['metadata'].items():
+                if isinstance(value, dict):
+                    parts.append(f"{key}:\n")
+                    for k, v in value.items():
+                        parts.append(f"  {k}: {v}\n")
+                else:
+                    parts.append(f"{key}: {value}\n")
+            parts.append("\n")
+
+        # Content
+        parts.append("TRANSCRIPTION\n")
+        parts.append("-" * 12 + "\n")
+        parts.append(content['content'] + "\n")
+
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(''.join(parts))
+
         return str(filepath)
     
     def _save_docx(self, directory: Path, filename: str, content: Dict, template: Dict) -> str:
@@ -144,9 +193,10 @@ class SermonFormatter:
         # Add content
         doc.add_heading('Sermon Transcription', level=2)
         
-        # Split content into paragraphs and add to document
-        paragraphs = content['content'].split('\n\n')
-        for para in paragraphs:
+        # Iterate paragraphs lazily so only one paragraph string is alive at
+        # a time instead of materializing the full split list up front
+        for match in _RE_PARA.finditer(content['content']):
+            para = match.group()
             if para.strip():
                 doc.add_paragraph(para)
         
@@ -154,25 +204,31 @@ class SermonFormatter:
         doc.save(str(filepath))
         return str(filepath)
     
+    def _clean_text(self, text: str) -> str:
+        """Capitalize sentences and fix punctuation in one pass over the text."""
+        if not text:
+            return text
+
+        return _RE_CLEAN.sub(_clean_repl, text).strip()
+
     def _capitalize_sentences(self, text: str) -> str:
         """Capitalize the first letter of each sentence."""
         if not text:
             return text
-            
-        sentences = text.split('. ')
-        sentences = [s[0].upper() + s[1:] if s else s for s in sentences]
-        return '. '.join(sentences)
+
+        # Single pass; only allocates for letters that actually need
+        # uppercasing, and handles '!'/'?' boundaries as well as '.'
+        return _RE_SENT.sub(lambda m: m.group(1).upper(), text)
     
     def _fix_punctuation(self, text: str) -> str:
         """Fix common punctuation issues."""
         if not text:
             return text
-            
+
         # Add space after period if missing
-        text = text.replace('.', '. ')
-        
-        # Remove double spaces
-        while '  ' in text:
-            text = text.replace('  ', ' ')
-            
+        text = _RE_DOT.sub('. ', text)
+
+        # Collapse runs of spaces in a single pass
+        text = _RE_SPACES.sub(' ', text)
+
         return text.strip()